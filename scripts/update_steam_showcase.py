@@ -11,14 +11,19 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import functools
+import hashlib
 import json
 import os
 import sys
-import textwrap
 import base64
 import mimetypes
+import re
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from string import Formatter
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 try:  # pragma: no cover - urllib is part of stdlib
     from urllib.request import urlopen
@@ -27,12 +32,64 @@ except ImportError:  # pragma: no cover
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:  # pragma: no cover - requests is part of the environment
     requests = None  # type: ignore
+    HTTPAdapter = None  # type: ignore
+    Retry = None  # type: ignore
+
+try:
+    import pybase64
+except ImportError:  # pragma: no cover - optional SIMD base64 codec
+    pybase64 = None  # type: ignore
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast JSON codec
+    orjson = None  # type: ignore
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional HTTP/2 transport
+    httpx = None  # type: ignore
 
 from xml.sax.saxutils import escape
 
 API_BASE = "https://api.steampowered.com"
+USER_AGENT = "steam-showcase/1.0"
+# Steam's full-size avatars are tens of KB; anything past this is not one.
+MAX_AVATAR_BYTES = 5 * 1024 * 1024
+_AVATAR_PREALLOCATE_BYTES = 1 << 20
+HTTP_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "steam-showcase"
+)
+
+# Maps A-Z to the regional indicator symbols that pair up into flag emoji.
+_FLAG_TABLE = str.maketrans({chr(ord("A") + i): chr(0x1F1E6 + i) for i in range(26)})
+
+# The profile dataclasses are frozen because their escaped render strings
+# are derived once in __post_init__; build a new instance (for example with
+# dataclasses.replace) to change a field. dataclass(slots=True) needs
+# Python 3.10; older interpreters keep __dict__.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+_b64encode = pybase64.b64encode if pybase64 else base64.b64encode
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, *, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode("utf-8")
+
 
 _DEFAULT_AVATAR_SVG = """
 <svg xmlns='http://www.w3.org/2000/svg' width='88' height='88' viewBox='0 0 88 88'>
@@ -50,24 +107,66 @@ _DEFAULT_AVATAR_SVG = """
 </svg>
 """.strip()
 
-DEFAULT_AVATAR_DATA_URI = "data:image/svg+xml;base64," + base64.b64encode(
-    _DEFAULT_AVATAR_SVG.encode("utf-8")
-).decode("ascii")
+# Characters left unescaped in SVG data URIs: valid in a URI and harmless
+# inside a double-quoted XML attribute.
+_SVG_URI_SAFE = "'=/:;,()!*+?@$"
+_XML_DECLARATION = re.compile(r"^\s*<\?xml[^>]*\?>")
+_INTER_TAG_WHITESPACE = re.compile(r">\s+<")
+
+
+def _svg_data_uri(svg: str) -> str:
+    # SVG is text: percent-encoding only the unsafe characters is smaller
+    # than base64 and leaves nothing for the browser to decode.
+    svg = _XML_DECLARATION.sub("", svg)
+    svg = _INTER_TAG_WHITESPACE.sub("><", svg.strip())
+    return "data:image/svg+xml;charset=utf-8," + urllib.parse.quote(svg, safe=_SVG_URI_SAFE)
+
+
+_AVATAR_IMAGE = (
+    '<image href="%s" x="24" y="26" width="88" height="88" '
+    'clip-path="url(#avatarClip)" preserveAspectRatio="xMidYMid slice" />'
+)
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def _default_avatar_markup() -> str:
+    # The bundled fallback is nested into the card as plain SVG rather than
+    # an <image> data URI, so browsers have nothing to decode. Only profiles
+    # without a fetched or cached avatar need it.
+    svg = _INTER_TAG_WHITESPACE.sub("><", _DEFAULT_AVATAR_SVG)
+    svg = svg.replace(" xmlns='http://www.w3.org/2000/svg'", "", 1)
+    return svg.replace("<svg ", "<svg x='24' y='26' ", 1)
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class BadgeHighlight:
     name: str
     level: Optional[int] = None
+    label_xml: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "label_xml", escape(self.label))
+
+    @property
+    def label(self) -> str:
+        if self.level:
+            return f"{self.name} · Lv{self.level}"
+        return self.name
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RecentGame:
     name: str
     playtime_2weeks: int
+    name_xml: str = field(init=False, repr=False, compare=False)
+    playtime_label: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name_xml", escape(self.name))
+        object.__setattr__(self, "playtime_label", human_minutes(self.playtime_2weeks))
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class SteamProfile:
     steamid: str
     personaname: str
@@ -83,6 +182,23 @@ class SteamProfile:
     level: Optional[int] = None
     badge_highlights: List[BadgeHighlight] = field(default_factory=list)
     recent_games: List[RecentGame] = field(default_factory=list)
+    # Rendering inputs are escaped once here rather than on every render.
+    personaname_xml: str = field(init=False, repr=False, compare=False)
+    profileurl_xml: str = field(init=False, repr=False, compare=False)
+    info_line_xml: str = field(init=False, repr=False, compare=False)
+    avatar_xml: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "personaname_xml", escape(self.personaname))
+        object.__setattr__(self, "profileurl_xml", escape(self.profileurl))
+        object.__setattr__(self, "info_line_xml", escape(self.info_line))
+        # Remote avatars stay behind <image>: an inlined third-party SVG could
+        # script the card, while an image data URI cannot.
+        if self.avatar_data_uri:
+            avatar_xml = _AVATAR_IMAGE % escape(self.avatar_data_uri)
+        else:
+            avatar_xml = _default_avatar_markup()
+        object.__setattr__(self, "avatar_xml", avatar_xml)
 
     @property
     def persona_state_label(self) -> str:
@@ -102,13 +218,21 @@ class SteamProfile:
         if not self.loccountrycode:
             return None
         code = self.loccountrycode.upper()
-        if len(code) != 2:
-            return None
-        base = 0x1F1E6
-        try:
-            return "".join(chr(base + ord(ch) - ord("A")) for ch in code)
-        except ValueError:
+        if len(code) != 2 or not (code.isascii() and code.isalpha()):
             return None
+        return code.translate(_FLAG_TABLE)
+
+    @property
+    def info_line(self) -> str:
+        info_lines: List[str] = []
+        if self.realname:
+            info_lines.append(self.realname)
+        flag = self.country_flag
+        if flag:
+            info_lines.append(flag)
+        if self.member_since:
+            info_lines.append(f"Member since {self.member_since}")
+        return "  ·  ".join(info_lines)
 
     @property
     def member_since(self) -> Optional[str]:
@@ -139,10 +263,127 @@ class SteamProfile:
         return f"{minutes}m ago"
 
 
+def create_session() -> requests.Session:
+    session = requests.Session()
+    # fetch_profile issues its API calls concurrently; size the pool so every
+    # worker thread keeps its own connection alive. requests already
+    # advertises gzip (and br when brotli is installed) by default.
+    retries = Retry(total=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8, max_retries=retries))
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+class Http2Session:
+    # The subset of requests.Session used by fetch_json and fetch_avatar_data,
+    # backed by httpx so the vanity lookup and the concurrent profile calls
+    # share one multiplexed HTTP/2 connection instead of opening one each.
+
+    def __init__(self) -> None:
+        self._client = httpx.Client(
+            transport=httpx.HTTPTransport(http2=True, retries=2),
+            headers={"User-Agent": USER_AGENT},
+            follow_redirects=True,
+        )
+
+    def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> _Http2Response:
+        request = self._client.build_request("GET", url, params=params, headers=headers, timeout=timeout)
+        # With stream=True the body is left unread so _read_body can pull it
+        # chunk by chunk; _Http2Response.__exit__ closes the stream.
+        return _Http2Response(self._client.send(request, stream=stream))
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class _Http2Response:
+    def __init__(self, response: httpx.Response) -> None:
+        self._response = response
+        self.status_code = response.status_code
+        self.headers = response.headers
+
+    def __enter__(self) -> _Http2Response:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._response.close()
+
+    def raise_for_status(self) -> None:
+        # Match requests, which only treats 4xx/5xx as errors.
+        if self.status_code >= 400:
+            self._response.raise_for_status()
+
+    @property
+    def content(self) -> bytes:
+        return self._response.content
+
+    def iter_content(self, chunk_size: int = 1) -> Iterator[bytes]:
+        return self._response.iter_bytes(chunk_size)
+
+
+def _http_cache_path(url: str, params: Dict[str, Any]) -> str:
+    # Params carry the API key, so only a digest of them reaches the disk.
+    key = f"{url}?{urllib.parse.urlencode(sorted(params.items()))}"
+    return os.path.join(HTTP_CACHE_DIR, hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json")
+
+
+def _read_http_cache(path: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "rb") as fh:
+            entry = _json_loads(fh.read())
+    except (OSError, ValueError):
+        return None
+    return entry if isinstance(entry, dict) and "body" in entry else None
+
+
+def _write_http_cache(path: str, entry: Dict[str, Any]) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "wb") as fh:
+            fh.write(_json_dumps(entry))
+        os.replace(tmp_path, path)
+    except OSError:  # pragma: no cover - cache is best effort
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
 def fetch_json(session: requests.Session, path: str, *, params: Dict[str, Any]) -> Dict[str, Any]:
-    response = session.get(f"{API_BASE}{path}", params=params, timeout=15)
+    url = f"{API_BASE}{path}"
+    cache_path = _http_cache_path(url, params)
+    cached = _read_http_cache(cache_path)
+    headers: Dict[str, str] = {}
+    if cached is not None:
+        if cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
+
+    response = session.get(url, params=params, headers=headers, timeout=15)
+    if response.status_code == 304:
+        if cached is not None:
+            return cached["body"]
+        # Nothing conditional was sent, so there is no body to fall back on.
+        raise RuntimeError(f"Unexpected 304 Not Modified for {path} without a cached response")
     response.raise_for_status()
-    return response.json()
+    # Parse the raw bytes; response.json() would decode them to str first.
+    data = _json_loads(response.content)
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag or last_modified:
+        _write_http_cache(cache_path, {"etag": etag, "last_modified": last_modified, "body": data})
+    return data
 
 
 def resolve_vanity(session: requests.Session, api_key: str, vanity: str) -> str:
@@ -160,11 +401,26 @@ def resolve_vanity(session: requests.Session, api_key: str, vanity: str) -> str:
     return str(steamid)
 
 
+_IMAGE_EXTENSION_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".webp": "image/webp",
+    ".svg": "image/svg+xml",
+}
+
+
 def _normalize_content_type(header: Optional[str], url: str) -> str:
     if header:
         ctype = header.split(";", 1)[0].strip()
         if ctype:
             return ctype
+    # Steam serves .jpg avatars; resolve the usual image extensions without
+    # making mimetypes load the system type database.
+    ext = os.path.splitext(urllib.parse.urlsplit(url).path)[1].lower()
+    if ext in _IMAGE_EXTENSION_TYPES:
+        return _IMAGE_EXTENSION_TYPES[ext]
     guess, _ = mimetypes.guess_type(url)
     return guess or "image/jpeg"
 
@@ -174,65 +430,119 @@ def fetch_avatar_data(session: Optional[requests.Session], url: str) -> Optional
         return None
     try:
         if session is not None:
-            response = session.get(url, timeout=15)
-            response.raise_for_status()
-            data = response.content
-            content_type = response.headers.get("Content-Type")
+            with session.get(url, stream=True, timeout=15) as response:
+                response.raise_for_status()
+                data = _read_body(response)
+                content_type = response.headers.get("Content-Type")
         elif urlopen is not None:  # pragma: no cover - fallback branch
             with urlopen(url, timeout=15) as fh:  # type: ignore[arg-type]
                 data = fh.read()
                 content_type = getattr(fh, "headers", {}).get("Content-Type") if hasattr(fh, "headers") else None
         else:  # pragma: no cover - only triggered when urllib missing
             return None
-    except Exception:  # pragma: no cover - network dependent
+    except Exception as exc:  # pragma: no cover - network dependent
+        print(f"Warning: avatar download failed ({exc}).", file=sys.stderr)
         return None
     if not data:
         return None
-    ctype = _normalize_content_type(content_type, url)
-    return f"data:{ctype};base64,{base64.b64encode(data).decode('ascii')}"
-
+    return _encode_avatar(data, _normalize_content_type(content_type, url))
 
-def fetch_profile(session: requests.Session, api_key: str, *, steamid: str) -> SteamProfile:
-    summary = fetch_json(
-        session,
-        "/ISteamUser/GetPlayerSummaries/v2/",
-        params={"key": api_key, "steamids": steamid},
-    )
-    players = summary.get("response", {}).get("players", [])
-    if not players:
-        raise RuntimeError(f"No player data returned for steamid {steamid}")
-    player = players[0]
-
-    level_data = fetch_json(
-        session,
-        "/IPlayerService/GetSteamLevel/v1/",
-        params={"key": api_key, "steamid": steamid},
-    )
-    level = level_data.get("response", {}).get("player_level")
-
-    badge_data = fetch_json(
-        session,
-        "/IPlayerService/GetBadges/v1/",
-        params={"key": api_key, "steamid": steamid},
-    )
-    badges = badge_data.get("response", {}).get("badges", []) or []
-    badge_highlights: List[BadgeHighlight] = []
-    for badge in badges[:3]:
-        name = badge.get("name") or badge.get("description") or "Badge"
-        badge_highlights.append(BadgeHighlight(name=name, level=badge.get("level")))
-
-    recent_data = fetch_json(
-        session,
-        "/IPlayerService/GetRecentlyPlayedGames/v1/",
-        params={"key": api_key, "steamid": steamid, "count": 3},
-    )
-    recent_games_raw = recent_data.get("response", {}).get("games", []) or []
-    recent_games = [
-        RecentGame(name=game.get("name", "Unknown"), playtime_2weeks=game.get("playtime_2weeks", 0))
-        for game in recent_games_raw
-    ]
 
-    avatar_data_uri = fetch_avatar_data(session, player.get("avatarfull", ""))
+def _read_body(response: requests.Response) -> bytearray:
+    # Fill one buffer sized from Content-Length instead of letting
+    # response.content join the chunks into a second full-size copy. The
+    # header is only trusted up to a cap; slice assignment grows the buffer
+    # past it if the body really is larger.
+    try:
+        size = int(response.headers.get("Content-Length", 0))
+    except ValueError:
+        size = 0
+    if size > MAX_AVATAR_BYTES:
+        raise ValueError(f"avatar is {size} bytes, over the {MAX_AVATAR_BYTES} byte limit")
+    buffer = bytearray(min(max(size, 0), _AVATAR_PREALLOCATE_BYTES))
+    offset = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        if offset + len(chunk) > MAX_AVATAR_BYTES:
+            raise ValueError(f"avatar exceeds the {MAX_AVATAR_BYTES} byte limit")
+        buffer[offset : offset + len(chunk)] = chunk
+        offset += len(chunk)
+    del buffer[offset:]
+    return buffer
+
+
+def _encode_avatar(data: bytes, ctype: str) -> str:
+    if ctype == "image/svg+xml":
+        try:
+            return _svg_data_uri(data.decode("utf-8"))
+        except UnicodeDecodeError:
+            pass
+    return f"data:{ctype};base64,{_b64encode(data).decode('ascii')}"
+
+
+def fetch_profile(
+    session: requests.Session,
+    api_key: str,
+    *,
+    steamid: str,
+    cached: Optional[SteamProfile] = None,
+) -> SteamProfile:
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        summary_future = executor.submit(
+            fetch_json,
+            session,
+            "/ISteamUser/GetPlayerSummaries/v2/",
+            params={"key": api_key, "steamids": steamid},
+        )
+        level_future = executor.submit(
+            fetch_json,
+            session,
+            "/IPlayerService/GetSteamLevel/v1/",
+            params={"key": api_key, "steamid": steamid},
+        )
+        badge_future = executor.submit(
+            fetch_json,
+            session,
+            "/IPlayerService/GetBadges/v1/",
+            params={"key": api_key, "steamid": steamid},
+        )
+        recent_future = executor.submit(
+            fetch_json,
+            session,
+            "/IPlayerService/GetRecentlyPlayedGames/v1/",
+            params={"key": api_key, "steamid": steamid, "count": 3},
+        )
+
+        players = summary_future.result().get("response", {}).get("players", [])
+        if not players:
+            raise RuntimeError(f"No player data returned for steamid {steamid}")
+        player = players[0]
+        avatar_url = player.get("avatarfull", "")
+        # Steam avatar URLs are content-addressed, so an unchanged URL means
+        # the cached data URI is still current. Otherwise start the download
+        # while the remaining API calls are still in flight.
+        if cached is not None and cached.avatar_data_uri and cached.avatarfull == avatar_url:
+            avatar_future = None
+        else:
+            avatar_future = executor.submit(fetch_avatar_data, session, avatar_url)
+
+        level = level_future.result().get("response", {}).get("player_level")
+
+        badges = badge_future.result().get("response", {}).get("badges", []) or []
+        badge_highlights: List[BadgeHighlight] = []
+        for badge in badges[:3]:
+            name = badge.get("name") or badge.get("description") or "Badge"
+            badge_highlights.append(BadgeHighlight(name=name, level=badge.get("level")))
+
+        recent_games_raw = recent_future.result().get("response", {}).get("games", []) or []
+        recent_games = [
+            RecentGame(name=game.get("name", "Unknown"), playtime_2weeks=game.get("playtime_2weeks", 0))
+            for game in recent_games_raw
+        ]
+
+        if avatar_future is None:
+            avatar_data_uri = cached.avatar_data_uri
+        else:
+            avatar_data_uri = avatar_future.result()
 
     return SteamProfile(
         steamid=str(player.get("steamid")),
@@ -253,8 +563,8 @@ def fetch_profile(session: requests.Session, api_key: str, *, steamid: str) -> S
 
 
 def load_cached_profile(path: str) -> SteamProfile:
-    with open(path, "r", encoding="utf-8") as fh:
-        raw = json.load(fh)
+    with open(path, "rb") as fh:
+        raw = _json_loads(fh.read())
     badge_highlights = [
         BadgeHighlight(name=item.get("name", "Badge"), level=item.get("level"))
         for item in raw.get("badge_highlights", [])
@@ -290,7 +600,84 @@ def human_minutes(minutes: int) -> str:
     return f"{mins}m"
 
 
-def render_svg(profile: SteamProfile) -> str:
+def _compile_template(template: str) -> List[Tuple[str, Optional[str]]]:
+    # Split into (literal, field) pairs once so filling the template is a
+    # plain join instead of rescanning the whole literal for braces each call.
+    return [(literal, field_name) for literal, field_name, _, _ in Formatter().parse(template)]
+
+
+def _fill_template(parts: List[Tuple[str, Optional[str]]], values: Dict[str, str]) -> str:
+    chunks: List[str] = []
+    for literal, field_name in parts:
+        chunks.append(literal)
+        if field_name is not None:
+            chunks.append(values[field_name])
+    return "".join(chunks)
+
+
+def _write_template(parts: List[Tuple[str, Optional[str]]], values: Dict[str, str], fh: TextIO) -> None:
+    for literal, field_name in parts:
+        fh.write(literal)
+        if field_name is not None:
+            fh.write(values[field_name])
+
+
+_SVG_TEMPLATE_SOURCE = """\
+<svg width="360" height="260" viewBox="0 0 360 260" fill="none" xmlns="http://www.w3.org/2000/svg">
+  <defs>
+    <linearGradient id="steamCardGradient" x1="0" y1="0" x2="1" y2="1">
+      <stop offset="0%" stop-color="#0B141C" />
+      <stop offset="45%" stop-color="#13283D" />
+      <stop offset="100%" stop-color="#1E405F" />
+    </linearGradient>
+    <filter id="steamCardShadow" x="-20%" y="-20%" width="140%" height="140%">
+      <feDropShadow dx="0" dy="14" stdDeviation="18" flood-color="#040A14" flood-opacity="0.55" />
+    </filter>
+    <clipPath id="avatarClip">
+      <rect x="24" y="26" width="88" height="88" rx="18" />
+    </clipPath>
+  </defs>
+  <g filter="url(#steamCardShadow)">
+    <rect x="0" y="0" width="360" height="260" rx="22" fill="url(#steamCardGradient)" stroke="rgba(102,192,244,0.35)" />
+  </g>
+  {avatar}
+  <rect x="24" y="26" width="88" height="88" rx="18" fill="rgba(15, 29, 44, 0.4)" stroke="rgba(102,192,244,0.45)" />
+  <g transform="translate(128 40)" font-family="'Segoe UI', 'Inter', sans-serif">
+    <text x="0" y="0" font-size="24" font-weight="700" fill="#F5FAFF">{personaname}</text>
+    <text x="0" y="18" font-size="12" fill="#90ABC4">{level_text}</text>
+    <text x="0" y="38" font-size="12" fill="#6E8BA8">{status}</text>
+    <text x="0" y="58" font-size="11" fill="#4DA6DA">{info_line}</text>
+  </g>
+  <g transform="translate(24 136)" font-family="'Segoe UI', 'Inter', sans-serif">
+    <rect width="312" height="52" rx="16" fill="rgba(15, 29, 44, 0.7)" stroke="rgba(102,192,244,0.3)" />
+    <text x="20" y="24" font-size="13" font-weight="600" fill="#66C0F4">Recent playtime</text>
+    <text x="20" y="36" font-size="12" fill="#B5D8F2">
+      <tspan x="20" dy="0">{recent_first}</tspan>
+{recent_lines}
+    </text>
+  </g>
+  <g transform="translate(24 196)" font-family="'Segoe UI', 'Inter', sans-serif">
+    <rect width="312" height="52" rx="16" fill="rgba(12, 24, 36, 0.65)" stroke="rgba(102,192,244,0.3)" />
+    <text x="20" y="24" font-size="13" font-weight="600" fill="#66C0F4">Badge highlights</text>
+    <text x="20" y="36" font-size="12" fill="#B5D8F2">
+      <tspan x="20" dy="0">{badge_first}</tspan>
+{badge_lines}
+    </text>
+  </g>
+  <a href="{profileurl}" target="_blank" rel="noreferrer">
+    <rect x="260" y="30" width="76" height="30" rx="10" fill="rgba(18, 42, 60, 0.75)" stroke="rgba(102,192,244,0.4)" />
+    <text x="298" y="50" font-family="'Segoe UI', 'Inter', sans-serif" font-size="11" font-weight="600" fill="#F5FAFF" text-anchor="middle">View</text>
+  </a>
+</svg>"""
+
+_SVG_TEMPLATE = _compile_template(_SVG_TEMPLATE_SOURCE)
+
+_RECENT_TSPAN = "<tspan x='20' dy='16'>%s — %s</tspan>"
+_BADGE_TSPAN = "<tspan x='20' dy='16'>%s</tspan>"
+_TSPAN_INDENT = "      "
+
+
+def _svg_values(profile: SteamProfile) -> Dict[str, str]:
     recent = profile.recent_games[:3]
     if not recent:
         recent = [RecentGame(name="No recent games", playtime_2weeks=0)]
@@ -298,88 +685,43 @@ def render_svg(profile: SteamProfile) -> str:
     if not badges:
         badges = [BadgeHighlight(name="Collector", level=None)]
 
-    def badge_label(badge: BadgeHighlight) -> str:
-        label = badge.name
-        if badge.level:
-            label += f" · Lv{badge.level}"
-        return label
-
-    info_lines: List[str] = []
-    if profile.realname:
-        info_lines.append(profile.realname)
-    flag = profile.country_flag
-    if flag:
-        info_lines.append(flag)
-    if profile.member_since:
-        info_lines.append(f"Member since {profile.member_since}")
-    info_line = "  ·  ".join(info_lines)
-
-    recent_lines = "".join(
-        f"<tspan x='20' dy='16'>{escape(game.name)} — {human_minutes(game.playtime_2weeks)}</tspan>"
-        for game in recent[1:]
-    )
-
-    badge_lines = "".join(
-        f"<tspan x='20' dy='16'>{escape(badge_label(badge))}</tspan>" for badge in badges[1:]
-    )
+    recent_lines = "".join([_RECENT_TSPAN % (game.name_xml, game.playtime_label) for game in recent[1:]])
+    badge_lines = "".join([_BADGE_TSPAN % badge.label_xml for badge in badges[1:]])
+    # The slots sit at column 0 in the template so an empty list leaves a
+    # blank line rather than one of trailing spaces.
+    if recent_lines:
+        recent_lines = _TSPAN_INDENT + recent_lines
+    if badge_lines:
+        badge_lines = _TSPAN_INDENT + badge_lines
 
     status = profile.persona_state_label
     if profile.last_seen and profile.personastate == 0:
         status += f" ({profile.last_seen})"
 
-    avatar = escape(profile.avatar_data_uri or DEFAULT_AVATAR_DATA_URI)
     level_text = f"Level {profile.level}" if profile.level is not None else "Level hidden"
 
-    return textwrap.dedent(
-        f"""
-        <svg width="360" height="260" viewBox="0 0 360 260" fill="none" xmlns="http://www.w3.org/2000/svg">
-          <defs>
-            <linearGradient id="steamCardGradient" x1="0" y1="0" x2="1" y2="1">
-              <stop offset="0%" stop-color="#0B141C" />
-              <stop offset="45%" stop-color="#13283D" />
-              <stop offset="100%" stop-color="#1E405F" />
-            </linearGradient>
-            <filter id="steamCardShadow" x="-20%" y="-20%" width="140%" height="140%">
-              <feDropShadow dx="0" dy="14" stdDeviation="18" flood-color="#040A14" flood-opacity="0.55" />
-            </filter>
-            <clipPath id="avatarClip">
-              <rect x="24" y="26" width="88" height="88" rx="18" />
-            </clipPath>
-          </defs>
-          <g filter="url(#steamCardShadow)">
-            <rect x="0" y="0" width="360" height="260" rx="22" fill="url(#steamCardGradient)" stroke="rgba(102,192,244,0.35)" />
-          </g>
-          <image href="{avatar}" x="24" y="26" width="88" height="88" clip-path="url(#avatarClip)" preserveAspectRatio="xMidYMid slice" />
-          <rect x="24" y="26" width="88" height="88" rx="18" fill="rgba(15, 29, 44, 0.4)" stroke="rgba(102,192,244,0.45)" />
-          <g transform="translate(128 40)" font-family="'Segoe UI', 'Inter', sans-serif">
-            <text x="0" y="0" font-size="24" font-weight="700" fill="#F5FAFF">{escape(profile.personaname)}</text>
-            <text x="0" y="18" font-size="12" fill="#90ABC4">{escape(level_text)}</text>
-            <text x="0" y="38" font-size="12" fill="#6E8BA8">{escape(status)}</text>
-            <text x="0" y="58" font-size="11" fill="#4DA6DA">{escape(info_line)}</text>
-          </g>
-          <g transform="translate(24 136)" font-family="'Segoe UI', 'Inter', sans-serif">
-            <rect width="312" height="52" rx="16" fill="rgba(15, 29, 44, 0.7)" stroke="rgba(102,192,244,0.3)" />
-            <text x="20" y="24" font-size="13" font-weight="600" fill="#66C0F4">Recent playtime</text>
-            <text x="20" y="36" font-size="12" fill="#B5D8F2">
-              <tspan x="20" dy="0">{escape(recent[0].name)} — {human_minutes(recent[0].playtime_2weeks)}</tspan>
-              {recent_lines}
-            </text>
-          </g>
-          <g transform="translate(24 196)" font-family="'Segoe UI', 'Inter', sans-serif">
-            <rect width="312" height="52" rx="16" fill="rgba(12, 24, 36, 0.65)" stroke="rgba(102,192,244,0.3)" />
-            <text x="20" y="24" font-size="13" font-weight="600" fill="#66C0F4">Badge highlights</text>
-            <text x="20" y="36" font-size="12" fill="#B5D8F2">
-              <tspan x="20" dy="0">{escape(badge_label(badges[0]))}</tspan>
-              {badge_lines}
-            </text>
-          </g>
-          <a href="{escape(profile.profileurl)}" target="_blank" rel="noreferrer">
-            <rect x="260" y="30" width="76" height="30" rx="10" fill="rgba(18, 42, 60, 0.75)" stroke="rgba(102,192,244,0.4)" />
-            <text x="298" y="50" font-family="'Segoe UI', 'Inter', sans-serif" font-size="11" font-weight="600" fill="#F5FAFF" text-anchor="middle">View</text>
-          </a>
-        </svg>
-        """
-    ).strip()
+    return {
+        "avatar": profile.avatar_xml,
+        "personaname": profile.personaname_xml,
+        "level_text": escape(level_text),
+        "status": escape(status),
+        "info_line": profile.info_line_xml,
+        "recent_first": f"{recent[0].name_xml} — {recent[0].playtime_label}",
+        "recent_lines": recent_lines,
+        "badge_first": badges[0].label_xml,
+        "badge_lines": badge_lines,
+        "profileurl": profile.profileurl_xml,
+    }
+
+
+def render_svg(profile: SteamProfile) -> str:
+    return _fill_template(_SVG_TEMPLATE, _svg_values(profile))
+
+
+def write_svg(profile: SteamProfile, fh: TextIO) -> None:
+    # Same output as render_svg, written chunk by chunk so a large embedded
+    # avatar is never copied into one full-size string first.
+    _write_template(_SVG_TEMPLATE, _svg_values(profile), fh)
 
 
 def save_profile_cache(profile: SteamProfile, path: str) -> None:
@@ -405,8 +747,8 @@ def save_profile_cache(profile: SteamProfile, path: str) -> None:
             for game in profile.recent_games
         ],
     }
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, ensure_ascii=False, indent=2)
+    with open(path, "wb") as fh:
+        fh.write(_json_dumps(data, indent=True))
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -417,37 +759,60 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--output", default="img/steam-profile-showcase.svg", help="Path to write the SVG output")
     parser.add_argument("--cache", help="Optional cache JSON to read when API is unavailable")
     parser.add_argument("--write-cache", help="Optional path to write fetched data for offline reuse")
+    parser.add_argument("--http2", action="store_true", help="Send API requests over HTTP/2 (requires httpx[http2])")
 
     args = parser.parse_args(argv)
 
     api_key = args.api_key or os.environ.get("STEAM_API_KEY")
 
-    session = requests.Session() if requests else None
+    if args.http2:
+        if httpx is None:
+            parser.error("--http2 requires the httpx package")
+        try:
+            session = Http2Session()
+        except ImportError as exc:
+            parser.error(f"--http2 is unavailable ({exc})")
+    else:
+        session = create_session() if requests else None
     profile: Optional[SteamProfile] = None
 
-    if api_key and session:
+    # The cache is only an avatar hint until the API fails, so a malformed
+    # file must not stop a working API run; the fallback below re-reads it
+    # and reports the error as before.
+    cached: Optional[SteamProfile] = None
+    if args.cache and os.path.exists(args.cache):
         try:
-            steamid = args.steamid or (
-                resolve_vanity(session, api_key, args.vanity) if args.vanity else None
-            )
-            if not steamid:
-                raise RuntimeError("A vanity handle or steamid must be provided when using the API")
-            profile = fetch_profile(session, api_key, steamid=steamid)
-        except Exception as exc:  # pragma: no cover - network dependent
-            print(f"Warning: API fetch failed ({exc}).", file=sys.stderr)
-            profile = None
+            cached = load_cached_profile(args.cache)
+        except Exception as exc:
+            print(f"Warning: could not read cache ({exc}).", file=sys.stderr)
+
+    try:
+        if api_key and session:
+            try:
+                steamid = args.steamid or (
+                    resolve_vanity(session, api_key, args.vanity) if args.vanity else None
+                )
+                if not steamid:
+                    raise RuntimeError("A vanity handle or steamid must be provided when using the API")
+                profile = fetch_profile(session, api_key, steamid=steamid, cached=cached)
+            except Exception as exc:  # pragma: no cover - network dependent
+                print(f"Warning: API fetch failed ({exc}).", file=sys.stderr)
+                profile = None
+    finally:
+        if session is not None:
+            session.close()
 
     if profile is None:
         if not args.cache:
             parser.error("API fetch failed and no cache provided")
-        profile = load_cached_profile(args.cache)
+        profile = cached or load_cached_profile(args.cache)
 
     if args.write_cache:
         save_profile_cache(profile, args.write_cache)
 
-    svg = render_svg(profile)
-    with open(args.output, "w", encoding="utf-8") as fh:
-        fh.write(svg + "\n")
+    with open(args.output, "w", encoding="utf-8", buffering=1 << 17) as fh:
+        write_svg(profile, fh)
+        fh.write("\n")
     return 0
 
 